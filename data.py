@@ -0,0 +1,44 @@
+import os
+import threading
+from functools import lru_cache, wraps
+
+import pandas as pd
+
+# Shared data services for all dashboard pages.
+# Each dataset is read lazily, the first time a page or callback asks for it,
+# and then kept for the lifetime of the process so every page and callback
+# works on the same DataFrame instead of loading its own copy.
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# lru_cache alone lets several threads that miss the cache at the same time
+# all compute the value; the lock makes the first build happen only once.
+def build_once(func):
+    cached = lru_cache(maxsize=None)(func)
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(*args):
+        with lock:
+            return cached(*args)
+
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
+## Global power plant data
+@build_once
+def load_power_plants():
+    return pd.read_csv(os.path.join(DATA_DIR, 'power_plant.csv'))
+
+
+## Tech layoffs data
+@build_once
+def load_layoffs():
+    df = pd.read_csv(os.path.join(DATA_DIR, 'layoffs_1.csv'))
+    df['date']= pd.to_datetime(df['date'])
+    df['bulan']= df['date'].dt.to_period('M')
+    df['bulan']= df['bulan'].dt.to_timestamp()
+    df['status'] = ['Publicly traded' if x =='IPO' else 'Privately owned' for x in df['stage']]
+    return df
@@ -0,0 +1,23 @@
+import multiprocessing
+import os
+
+# gunicorn settings for wsgi.py, run with
+#   gunicorn -c gunicorn.conf.py wsgi:server
+# Every setting can be overridden through the environment variables below.
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8050')
+
+## Concurrency
+# Callbacks are mostly pandas/plotly work, so processes give the real
+# parallelism; a few threads per worker keep it busy while responses are
+# being written to slow clients.
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread'
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+keepalive = 5
+
+## Preloading
+# Import wsgi.py (and so load the data and build the layouts) once in the
+# master, before forking, so the workers share it copy-on-write.
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') == '1'
@@ -0,0 +1,195 @@
+import argparse
+import csv
+import http.client
+import itertools
+import json
+import os
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+# Local HTTP load generator replaying the dropdown callbacks of both pages.
+#
+# Compare the development server with the production entry point:
+#   python app.py                                  # serves on :8050
+#   python loadtest.py --label run_server
+#
+#   gunicorn -c gunicorn.conf.py wsgi:server       # serves on :8050
+#   python loadtest.py --label gunicorn
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+## Callbacks fired by each dropdown (output id, output property)
+POWER_PLANT_OUTPUTS = [
+    ('plotranking', 'figure'),
+    ('plotdistribution', 'figure'),
+    ('plotpie', 'figure'),
+]
+
+LAYOFFS_OUTPUTS = [
+    ('total_companies', 'children'),
+    ('total_laid_off', 'children'),
+    ('area_plot', 'figure'),
+    ('pie_plot', 'figure'),
+    ('scatter_plot', 'figure'),
+    ('bar_industry', 'figure'),
+    ('bar_company', 'figure'),
+    ('bar_city', 'figure'),
+]
+
+
+def read_countries(filename, column, limit):
+    with open(os.path.join(DATA_DIR, filename), encoding='utf-8') as f:
+        countries = sorted({row[column] for row in csv.DictReader(f)})
+    return countries[:limit]
+
+
+def callback_payload(output_id, output_property, input_id, value):
+    return json.dumps({
+        'output': f'{output_id}.{output_property}',
+        'outputs': {'id': output_id, 'property': output_property},
+        'inputs': [{'id': input_id, 'property': 'value', 'value': value}],
+        'changedPropIds': [f'{input_id}.value'],
+    })
+
+
+# Request sent by dash.page_container when the browser navigates to a page
+def page_payload(pathname):
+    return json.dumps({
+        'output': '.._pages_content.children..._pages_store.data..',
+        'outputs': [
+            {'id': '_pages_content', 'property': 'children'},
+            {'id': '_pages_store', 'property': 'data'},
+        ],
+        'inputs': [
+            {'id': '_pages_location', 'property': 'pathname', 'value': pathname},
+            {'id': '_pages_location', 'property': 'search', 'value': ''},
+        ],
+        'changedPropIds': ['_pages_location.pathname'],
+    })
+
+
+def warm_up(host, port, payloads):
+    conn = http.client.HTTPConnection(host, port, timeout=60)
+    headers = {'Content-Type': 'application/json'}
+
+    # The index page registers the pages router, then each page is opened
+    # through it so build_layout() runs, then its dropdown callbacks are fired
+    requests = [('GET', '/', None)]
+    requests += [('POST', '/_dash-update-component', page_payload(path)) for path in ('/', '/layoffs')]
+    requests += [('POST', '/_dash-update-component', body) for body in payloads]
+
+    for method, path, body in requests:
+        conn.request(method, path, body=body, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        if response.status != 200:
+            conn.close()
+            raise SystemExit(f'Warm-up failed: {method} {path} returned {response.status}')
+    conn.close()
+
+
+def build_payloads(countries):
+    payloads = []
+
+    for country in read_countries('power_plant.csv', 'country_long', countries):
+        for output_id, output_property in POWER_PLANT_OUTPUTS:
+            payloads.append(callback_payload(output_id, output_property, 'choose_country', country))
+
+    layoffs_countries = ['All country'] + read_countries('layoffs_1.csv', 'country', countries)
+    for country in layoffs_countries:
+        for output_id, output_property in LAYOFFS_OUTPUTS:
+            payloads.append(callback_payload(output_id, output_property, 'pick_country', country))
+
+    return payloads
+
+
+def worker(host, port, payloads, deadline, latencies, errors, lock):
+    conn = http.client.HTTPConnection(host, port, timeout=60)
+    headers = {'Content-Type': 'application/json', 'Accept-Encoding': 'gzip, br'}
+    local_latencies = []
+    local_errors = 0
+
+    for body in payloads:
+        if time.perf_counter() >= deadline:
+            break
+        start = time.perf_counter()
+        try:
+            conn.request('POST', '/_dash-update-component', body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                local_errors += 1
+                continue
+        except (OSError, http.client.HTTPException):
+            local_errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=60)
+            continue
+        local_latencies.append(time.perf_counter() - start)
+
+    conn.close()
+    with lock:
+        latencies.extend(local_latencies)
+        errors.append(local_errors)
+
+
+def percentile(values, q):
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay dashboard dropdown callbacks against a running server.')
+    parser.add_argument('--url', default='http://127.0.0.1:8050', help='base URL of the dashboard server')
+    parser.add_argument('--concurrency', type=int, default=16, help='number of concurrent clients')
+    parser.add_argument('--duration', type=float, default=30, help='test duration in seconds')
+    parser.add_argument('--countries', type=int, default=20, help='countries replayed per dropdown')
+    parser.add_argument('--label', default='', help='name printed with the results')
+    args = parser.parse_args()
+
+    url = urlsplit(args.url)
+    payloads = build_payloads(args.countries)
+
+    # Open both pages once so first-visit loading is not measured
+    warm_up(url.hostname, url.port or 80, payloads[:len(POWER_PLANT_OUTPUTS)] + payloads[-len(LAYOFFS_OUTPUTS):])
+
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    threads = []
+    for i in range(args.concurrency):
+        # Every client replays the callbacks in its own order, forever
+        offset = i * len(payloads) // args.concurrency
+        replay = itertools.cycle(payloads[offset:] + payloads[:offset])
+        thread = threading.Thread(
+            target=worker,
+            args=(url.hostname, url.port or 80, replay, deadline, latencies, errors, lock),
+        )
+        threads.append(thread)
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    if not latencies:
+        print('No successful requests')
+        return
+
+    latencies.sort()
+    print(f"{args.label or args.url}: {len(latencies)} requests, {sum(errors)} errors in {elapsed:.1f}s")
+    print(f"  requests/sec: {len(latencies) / elapsed:.1f}")
+    print(f"  latency (ms): mean {1000 * statistics.mean(latencies):.0f}, "
+          f"p50 {1000 * percentile(latencies, 0.50):.0f}, "
+          f"p95 {1000 * percentile(latencies, 0.95):.0f}, "
+          f"p99 {1000 * percentile(latencies, 0.99):.0f}, "
+          f"max {1000 * latencies[-1]:.0f}")
+
+
+if __name__ == "__main__":
+    main()
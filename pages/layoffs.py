@@ -1,73 +1,61 @@
 import dash
 from dash import dcc
 from dash import html
+from dash import callback
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output
 from statistics import mode
 import pandas as pd
 import plotly.express as px
 
-# 2. Create a Dash app instance
-app = dash.Dash(
-    external_stylesheets=[dbc.themes.JOURNAL],
-    name='Tech Layoffs 2020-2022'
-    )
-
-app.title = 'Tech Layoffs 2020-2022'
-
-df = pd.read_csv(r'layoffs_1.csv')
-df['date']= pd.to_datetime(df['date'])
-df['bulan']= df['date'].dt.to_period('M')
-df['bulan']= df['bulan'].dt.to_timestamp()
-df['status'] = ['Publicly traded' if x =='IPO' else 'Privately owned' for x in df['stage']]
-most_updated_date = df['date'].max()
+from data import build_once, load_layoffs
 
-options_dropdown = df['country'].unique().tolist()
-options_dropdown.sort()
-options_dropdown.insert(0, 'All country')
-
-## Navigation bar
-navbar = dbc.NavbarSimple(
-    
-    brand="Tech Layoffs Dashboard",
-    brand_href="#",
-    color="primary",
-    dark=True,
-)
+# Register the page on the multi-page host (app.py)
+dash.register_page(
+    __name__,
+    path='/layoffs',
+    name='Tech Layoffs 2020-2022',
+    title='Tech Layoffs 2020-2022'
+    )
 
-## Card Content
-total_companies = [
-    dbc.CardHeader('Number of companies'),
-    dbc.CardBody([
-        html.H5(id='total_companies')
-    ]),
-]
 
-total_laid_off = [
-    dbc.CardHeader('Number of people laid off'),
-    dbc.CardBody([
-        html.H5(id='total_laid_off')
-    ]),
-]
+# The dataset and the layout are only built the first time this page is
+# visited, then reused for every later visit.
+@build_once
+def build_layout():
+    df = load_layoffs()
+    most_updated_date = df['date'].max()
 
-data_terbaru = [
-    dbc.CardHeader('Data updated as of'),
-    dbc.CardBody([
-        html.H5(f"{most_updated_date.strftime('%A')}, {most_updated_date.strftime('%d')} {most_updated_date.strftime('%b')} {most_updated_date.strftime('%Y')}")
-    ])
-]
+    options_dropdown = df['country'].unique().tolist()
+    options_dropdown.sort()
+    options_dropdown.insert(0, 'All country')
 
+    ## Card Content
+    total_companies = [
+        dbc.CardHeader('Number of companies'),
+        dbc.CardBody([
+            html.H5(id='total_companies')
+        ]),
+    ]
 
-#### Layout
+    total_laid_off = [
+        dbc.CardHeader('Number of people laid off'),
+        dbc.CardBody([
+            html.H5(id='total_laid_off')
+        ]),
+    ]
 
-app.layout = html.Div([
-    navbar,
+    data_terbaru = [
+        dbc.CardHeader('Data updated as of'),
+        dbc.CardBody([
+            html.H5(f"{most_updated_date.strftime('%A')}, {most_updated_date.strftime('%d')} {most_updated_date.strftime('%b')} {most_updated_date.strftime('%Y')}")
+        ])
+    ]
 
-    html.Br(),
 
-    # Component main page
+    #### Layout
 
-    html.Div([ 
+    return html.Div([
         ## Row 1  
         dbc.Row(
             [
@@ -148,17 +136,22 @@ app.layout = html.Div([
     ], style={
         'paddingLeft':'30px',
         'paddingRight':'30px'
-    }), 
+    })
+
+
+def layout(**kwargs):
+    return build_layout()
+
 
-])
 # Callback update company
 
-@app.callback(
+@callback(
     Output(component_id='total_companies', component_property='children'),
     Input(component_id='pick_country', component_property='value')
 )
 
 def update_company(country):
+    df = load_layoffs()
 
     if  country=='All country':
 
@@ -174,12 +167,13 @@ def update_company(country):
 
 #Callback update total laid off
 
-@app.callback(
+@callback(
     Output(component_id='total_laid_off', component_property='children'),
     Input(component_id='pick_country', component_property='value')
 )
 
 def update_number_laid_off(country):
+    df = load_layoffs()
 
     if  country=='All country':
         
@@ -192,12 +186,13 @@ def update_number_laid_off(country):
 
         return x
 
-@app.callback(
+@callback(
     Output(component_id='area_plot', component_property='figure'),
     Input(component_id='pick_country', component_property='value')
 )
 
 def update_area_plot(country):
+    df = load_layoffs()
 
     if country== 'All country':
         group = pd.pivot_table(df, index='bulan', values='total_laid_off', aggfunc='sum').reset_index()
@@ -230,12 +225,13 @@ def update_area_plot(country):
 
 # Callback Pie plot
 
-@app.callback(
+@callback(
     Output(component_id='pie_plot', component_property='figure'),
     Input(component_id='pick_country', component_property='value')
 
 )
 def update_pie(country):
+    df = load_layoffs()
     if country == 'All country':
         
         status = pd.pivot_table(df, 
@@ -277,13 +273,14 @@ def update_pie(country):
 
 # Callback Scatter
 
-@app.callback(
+@callback(
     Output(component_id='scatter_plot', component_property='figure'),
     Input(component_id='pick_country', component_property='value')
 
 )
 
 def update_scatter(country):
+    df = load_layoffs()
     
     if country == 'All country':
 
@@ -308,12 +305,13 @@ def update_scatter(country):
         return sketer
 
 
-@app.callback(
+@callback(
     Output(component_id='bar_industry', component_property='figure'),
     Input(component_id='pick_country', component_property='value')
 )
 
 def update_industry(country):
+    df = load_layoffs()
     if country == 'All country':
 
         industry = pd.pivot_table(df, 
@@ -351,12 +349,13 @@ def update_industry(country):
         return bar_1
 
 
-@app.callback(
+@callback(
     Output(component_id='bar_company', component_property='figure'),
     Input(component_id='pick_country', component_property='value')
 )
 
 def update_company(country):
+    df = load_layoffs()
     if country == 'All country':
 
         company = pd.pivot_table(df, 
@@ -394,12 +393,13 @@ def update_company(country):
         return bar_2
 
 
-@app.callback(
+@callback(
     Output(component_id='bar_city', component_property='figure'),
     Input(component_id='pick_country', component_property='value')
 )
 
 def update_city(country):
+    df = load_layoffs()
     if country == 'All country':
 
         lokasi = pd.pivot_table(df, 
@@ -435,8 +435,3 @@ def update_city(country):
         bar_3.update_traces(hovertemplate=' <b>%{x}</b> employees working in <b>%{y}</b> were laid off')
         
         return bar_3
-
-
-# 3. Start the Dash server
-if __name__ == "__main__":
-    app.run_server()
\ No newline at end of file
@@ -0,0 +1,221 @@
+import dash
+from dash import dcc
+from dash import html
+from dash import callback
+import dash_bootstrap_components as dbc
+from dash.dependencies import Input, Output
+from statistics import mode
+import pandas as pd
+import plotly.express as px
+
+from data import build_once, load_power_plants
+
+# Register the page on the multi-page host (app.py)
+dash.register_page(
+    __name__,
+    path='/',
+    name='Global power plant',
+    title='World power plant dashboard'
+    )
+
+
+# The dataset and the layout (cards + choropleth) are only built the first
+# time this page is visited, then reused for every later visit.
+@build_once
+def build_layout():
+    gpp = load_power_plants()
+
+    ## Card Content
+    total_country = [
+        dbc.CardHeader('Number of Country'),
+        dbc.CardBody([
+            html.H1(gpp['country_long'].nunique())
+        ]),
+    ]
+
+    total_pp = [
+        dbc.CardHeader('Number of Power plants'),
+        dbc.CardBody([
+            html.H1(gpp['name of powerplant'].nunique())
+        ]),
+    ]
+
+    total_fuel = [
+        dbc.CardHeader('Most Used Fuel', style={"color":"black"}),
+        dbc.CardBody([
+            html.H1(f"{mode(gpp['primary_fuel'])} = {len(gpp[gpp['primary_fuel']==(gpp.describe(include='object')).loc['top','primary_fuel']])}")
+        ])
+    ]
+
+
+    ####CHOROPLEY
+    # Data aggregation
+    agg1 = pd.crosstab(
+        index=[gpp['country code'], gpp['start_year']],
+        columns='No of Power Plant'
+    ).reset_index()
+
+    # Visualization
+    plot_map = px.choropleth(agg1.sort_values(by="start_year"),
+                 locations='country code',
+                  color_continuous_scale='tealgrn',
+                 color='No of Power Plant',
+                 animation_frame='start_year',
+                 template='ggplot2')
+
+
+    #### Layout
+
+    return html.Div([
+        ## Row 1
+        dbc.Row(
+            [
+            ### Column 1
+            dbc.Col(
+                [
+                    dbc.Card(total_country, color='white'),
+                    html.Br(),
+                    dbc.Card(total_pp, color='blue'),
+                    html.Br(),
+                    dbc.Card(total_fuel, color='turquoise'),
+                ],
+                width=3),
+
+            ### Column 2
+            dbc.Col([
+                dcc.Graph(figure=plot_map),
+            ], width=9),
+            ]
+        ),
+
+        html.Hr(),
+
+        ## Row 2
+        dbc.Row(
+            [
+            ### Column 1
+            dbc.Col([
+                html.H1('Analysis by Country'),
+                dbc.Tabs([
+                    #TAB 1 : Ranking
+                    dbc.Tab(
+                        dcc.Graph(
+                            id='plotranking'
+                        ),
+                        label='Ranking'),
+
+                    #TAB 2: distribution
+                    dbc.Tab(
+                        dcc.Graph(
+                            id='plotdistribution',
+                        ),
+                        label='Distribution'),
+                ]),
+            ], width=8),
+
+            ### Column 2
+            dbc.Col([
+                dbc.Card([
+                    dbc.CardHeader('Select Country'),
+                    dbc.CardBody(
+                        dcc.Dropdown(
+                            id='choose_country',
+                            options=gpp['country_long'].unique(),
+                            value='Indonesia'
+                        ),
+                    ),
+                ]),
+                dcc.Graph(
+                    id='plotpie',
+                ),
+            ],
+
+                width=4),
+
+            ]
+        )
+    ], style={
+        'paddingLeft':'30px',
+        'paddingRight':'30px'
+    })
+
+
+def layout(**kwargs):
+    return build_layout()
+
+
+### Callback plot ranking
+@callback(
+    Output(component_id='plotranking', component_property='figure'),
+    Input(component_id='choose_country', component_property='value')
+)
+
+def update_plotrank(country_name):
+    gpp = load_power_plants()
+    gpp_indo = gpp[gpp['country_long']== country_name]
+
+    top_indo = gpp_indo.sort_values('capacity in MW').tail(10)
+
+# Visualize
+    plot_ranking = px.bar(
+    top_indo,
+    x = 'capacity in MW',
+    y = 'name of powerplant',
+    template = 'ggplot2',
+    title = f'Ranking of Overall Power Plants in {str(country_name)}'
+)
+    return plot_ranking
+
+
+### Callback plot distribution
+@callback(
+    Output(component_id='plotdistribution', component_property='figure'),
+    Input(component_id='choose_country', component_property='value')
+)
+
+def update_plotdist(country_name):
+    gpp = load_power_plants()
+    gpp_indo = gpp[gpp['country_long']== country_name]
+
+    plot_distribution = px.box(
+    gpp_indo,
+    color='primary_fuel',
+    y='capacity in MW',
+    template='ggplot2',
+    title='Distribution of capacity in MW in each fuel',
+    labels={
+        'primary_fuel': 'Type of Fuel'
+    }
+    ).update_xaxes(visible=False)
+    return plot_distribution
+
+### Callback pie chart
+@callback(
+    Output(component_id='plotpie', component_property='figure'),
+    Input(component_id='choose_country', component_property='value')
+)
+
+def update_pie(country_name):
+    gpp = load_power_plants()
+    gpp_indo = gpp[gpp['country_long']== country_name]
+
+    # aggregation
+    agg2=pd.crosstab(
+    index=gpp_indo['primary_fuel'],
+    columns='No of Power Plant'
+    ).reset_index()
+
+    # visualize
+    plot_pie = px.pie(
+    agg2,
+    values='No of Power Plant',
+    names='primary_fuel',
+    color_discrete_sequence=['aquamarine', 'salmon', 'plum', 'grey', 'slateblue'],
+    template='ggplot2',
+    hole=0.4,
+    title = f'Proportion of Overall Power Plants primary fuel in {str(country_name)}',
+    labels={
+        'primary_fuel': 'Type of Fuel'
+    }
+    )
+    return plot_pie
@@ -0,0 +1,35 @@
+import os
+
+import dash
+from plotly.io.json import to_json_plotly
+
+# Production entry point, e.g.
+#   gunicorn -c gunicorn.conf.py wsgi:server
+# app.run_server() in app.py starts Flask's development server, a single
+# process that should not be used to serve the dashboards.
+
+## Response compression (gzip/brotli) of layouts, figures and assets
+# Dash's own `compress` option, read from DASH_COMPRESS when app.py creates
+# the app. It defaults to on when served through this entry point; set
+# DASH_COMPRESS=false to turn it off.
+os.environ.setdefault('DASH_COMPRESS', 'true')
+
+from app import app
+
+
+## Preloading
+# Read every dataset and build every page layout (aggregates and figures
+# included) before the workers are forked. With gunicorn's preload_app the
+# workers then share these objects copy-on-write instead of each loading
+# its own copy on the first visit.
+# Serializing the layouts also imports the JSON engine up front, instead of
+# in several request threads at once.
+def preload():
+    for page in dash.page_registry.values():
+        to_json_plotly(page['layout']())
+
+
+if os.environ.get('DASH_PRELOAD', '1') == '1':
+    preload()
+
+server = app.server